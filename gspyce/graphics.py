@@ -1,4 +1,5 @@
 import os
+import array
 import pkgutil
 import itertools
 import functools
@@ -6,6 +7,51 @@ from OpenGL.GLUT import *
 from OpenGL.GL import *
 
 
+def set_swap_interval(interval=1):
+    """Synchronize buffer swaps with the display refresh (VSync)
+
+    `interval` is the number of refreshes to wait between swaps (0 disables
+    synchronization). This is not covered by GLUT, so the platform-specific
+    extensions are tried in turn. Return True if one of them was available;
+    otherwise, the frame rate is only limited by Scene.update()."""
+    try:  # X11
+        from OpenGL import GLX
+        from OpenGL.GLX.EXT.swap_control import glXSwapIntervalEXT
+        from OpenGL.GLX.MESA.swap_control import glXSwapIntervalMESA
+        from OpenGL.GLX.SGI.swap_control import glXSwapIntervalSGI
+    except (ImportError, AttributeError):  # not a GLX platform
+        pass
+    else:
+        try:
+            if bool(glXSwapIntervalEXT):
+                display = GLX.glXGetCurrentDisplay()
+                drawable = GLX.glXGetCurrentDrawable()
+                glXSwapIntervalEXT(display, drawable, interval)
+                return True
+            if bool(glXSwapIntervalMESA):
+                glXSwapIntervalMESA(interval)
+                return True
+            if bool(glXSwapIntervalSGI) and interval > 0:
+                glXSwapIntervalSGI(interval)
+                return True
+        except Exception:
+            pass
+
+    try:  # Windows
+        from OpenGL.WGL.EXT.swap_control import wglSwapIntervalEXT
+    except (ImportError, AttributeError):  # not a WGL platform
+        pass
+    else:
+        try:
+            if bool(wglSwapIntervalEXT):
+                wglSwapIntervalEXT(interval)
+                return True
+        except Exception:
+            pass
+
+    return False
+
+
 def read_pixels(x, y, w, h):
     """Wrapper function to fix inconsistencies PyOpenGL's glReadPixels()"""
     # `outputType` forces output to be a grid (avoids Linux vs Windows issues)
@@ -24,10 +70,15 @@ def read_pixels(x, y, w, h):
 
 class BufferObject:
     """OpenGL Buffer Object helper"""
-    def __init__(self, data=None, flatten=False):
-        """Create a new Buffer Object, optionally fill it (see `fill()`)"""
+    def __init__(self, data=None, flatten=False, usage=GL_STATIC_DRAW):
+        """Create a new Buffer Object, optionally fill it (see `fill()`)
+
+        `usage` is a hint to OpenGL on how often the data will be updated
+        (GL_STATIC_DRAW, GL_DYNAMIC_DRAW or GL_STREAM_DRAW)"""
         self.index = glGenBuffers(1)
         self.size = 0
+        self.capacity = 0  # number of floats that fit in the GPU storage
+        self.usage = usage
         if data is not None:
             self.fill(data, flatten)
 
@@ -42,16 +93,24 @@ class BufferObject:
     def fill(self, data, flatten=False):
         """Fill the Buffer Object with data (assume list of floats)
 
-        If `flatten`, assume data is an iterable of iterables and flatten it"""
+        If `flatten`, assume data is an iterable of iterables and flatten it
+
+        The GPU storage is only reallocated when it is too small for the new
+        data; in that case, its capacity is at least doubled so that buffers
+        refilled every frame are not reallocated every frame."""
         if flatten:
             data = itertools.chain(*data)
-        # pack as float[]
-        data = list(data)  # need length for ctypes array
+        # pack as float[] (array.array is much faster than unpacking the
+        # values into the ctypes constructor, which then shares its memory)
+        data = array.array('f', data)
         self.size = len(data)
-        data_buffer = (ctypes.c_float*self.size)(*data)
+        data_buffer = (ctypes.c_float*self.size).from_buffer(data)
         # send to GPU
         self.bind()
-        glBufferData(GL_ARRAY_BUFFER, data_buffer, GL_STATIC_DRAW)
+        if self.size > self.capacity:
+            self.capacity = max(self.size, 2*self.capacity)
+            glBufferData(GL_ARRAY_BUFFER, self.capacity*4, None, self.usage)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, self.size*4, data_buffer)
         self.unbind()
 
 
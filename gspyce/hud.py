@@ -16,12 +16,26 @@ class HUD(gspyce.scene.Scene):
         self.character_height = 19
         self.font = gspyce.textures.load("font.png")
 
-        # set up buffer objects
-        self.text_vbo = BufferObject()
-        self.text_tbo = BufferObject()
-
-        # sliding window of frame timings
-        self.frame_timings = collections.deque([time.time()], 60)
+        # texture coordinates (u0, v0, u1, v1) of each printable character
+        self.glyph_texcoords = {}
+        for c in range(32, 127):
+            row, col = divmod(c - 32, 16)  # skip non-printable characters
+            self.glyph_texcoords[chr(c)] = (
+                col / 16., (6 - row) / 6.,
+                (col + 1) / 16., (6 - (row + 1)) / 6.,
+            )
+
+        # vertices of recently printed strings, most recent last
+        self.hud_cache = collections.OrderedDict()
+        self.hud_cache_size = 256
+
+        # set up buffer object (refilled every frame)
+        # each vertex is stored as x, y, u, v (interleaved texcoords)
+        self.text_buffer = BufferObject(usage=GL_DYNAMIC_DRAW)
+
+        # exponential moving average of the frame duration (s)
+        self.last_frame_time = time.perf_counter()
+        self.average_frame_duration = None
 
     def hud_move(self, x, y):
         """Move the cursor to float coordinates (x, y)"""
@@ -47,55 +61,77 @@ class HUD(gspyce.scene.Scene):
     def hud_print(self, string):
         """Print a string to HUD after draw_hud() has been called"""
 
-        def append_vertex(row, col, delta_x, delta_y):
-            """Add quad vertex for a character at (row, col)"""
-            self.vertcoords += [
-                self.hud_x + self.character_width * delta_x,
-                self.hud_y + self.character_height * delta_y,
-            ]
-            self.texcoords += [
-                (col + delta_x) / 16.,
-                (6 - (row + delta_y)) / 6.,
-            ]
+        # most lines of the HUD are the same from one frame to the next
+        key = (string, self.hud_x, self.hud_y)
+        try:
+            vertices, self.hud_x, self.hud_y = self.hud_cache[key]
+        except KeyError:
+            vertices = self.hud_layout(string)
+            self.hud_cache[key] = vertices, self.hud_x, self.hud_y
+            if len(self.hud_cache) > self.hud_cache_size:
+                self.hud_cache.popitem(last=False)  # least recently used
+        else:
+            self.hud_cache.move_to_end(key)
+
+        self.hud_vertices += vertices
+
+    def hud_layout(self, string):
+        """Return the vertices (with texcoords) to print a string to HUD
+
+        The cursor is moved to the end of the string."""
+
+        vertices = []
+        glyph_texcoords = self.glyph_texcoords
+        unknown_texcoords = glyph_texcoords['?']
+        width = self.character_width
+        height = self.character_height
 
         initial_x = self.hud_x  # save column for carriage returns
         for c in string:
             if c == "\n":
                 # go down and back for next line
                 self.hud_x = initial_x
-                self.hud_y += self.character_height
+                self.hud_y += height
                 continue
             elif c == "\t":
-                self.hud_x += self.character_width*4
+                self.hud_x += width*4
                 continue
 
-            # locate the character in the font bitmap
-            c = ord(c)
-            if not (32 <= c < 127):
-                c = 63  # '?'
-            c -= 32  # skip non-printable characters
-            row, col = c // 16, c % 16
-
-            # append vertices
-            append_vertex(row, col, 0, 0)
-            append_vertex(row, col, 0, 1)
-            append_vertex(row, col, 1, 1)
-            append_vertex(row, col, 1, 1)
-            append_vertex(row, col, 1, 0)
-            append_vertex(row, col, 0, 0)
+            # append the vertices of the quad of the character
+            x0, y0 = self.hud_x, self.hud_y
+            x1, y1 = x0 + width, y0 + height
+            u0, v0, u1, v1 = glyph_texcoords.get(c, unknown_texcoords)
+            vertices += [
+                x0, y0, u0, v0,
+                x0, y1, u0, v1,
+                x1, y1, u1, v1,
+                x1, y1, u1, v1,
+                x1, y0, u1, v0,
+                x0, y0, u0, v0,
+            ]
 
             # skip forward to next character
-            self.hud_x += self.character_width
+            self.hud_x = x1
+
+        return vertices
 
     def draw_hud(self):
         """Draw the HUD"""
 
-        # this is a fixed-length queue (automatically drops oldest timing)
-        self.frame_timings.append(time.time())
+        now = time.perf_counter()
+        frame_duration = now - self.last_frame_time
+        self.last_frame_time = now
         # compute fps as the inverse of a moving average
-        elapsed = self.frame_timings[-1] - self.frame_timings[0]
-        # with n timings, we measure n-1 consecutives frames
-        fps = (len(self.frame_timings) - 1.) / elapsed
+        if self.average_frame_duration is None:
+            self.average_frame_duration = frame_duration
+        else:
+            alpha = 0.1  # smoothing factor (weight of the newest frame)
+            self.average_frame_duration += \
+                alpha * (frame_duration - self.average_frame_duration)
+        if self.average_frame_duration > 0:
+            fps = 1. / self.average_frame_duration
+        else:
+            fps = 0.
 
         if fps < 9.5:  # 10 is even so 9.5 is rounded up
             self.hud_print("%.1f FPS\n" % fps)
@@ -116,8 +152,7 @@ class HUD(gspyce.scene.Scene):
         self.set_modelview_matrix(Mat4())
 
         # reset HUD
-        self.texcoords = []
-        self.vertcoords = []
+        self.hud_vertices = []
         self.hud_grid(0, 1)
 
         # fill vertex lists
@@ -125,26 +160,28 @@ class HUD(gspyce.scene.Scene):
 
         program = self.current_shader
 
+        # upload everything at once
+        self.text_buffer.fill(self.hud_vertices)
+        self.text_buffer.bind()
+        stride = 4 * 4  # x, y, u, v as floats
+
         # vertices
         var = glGetAttribLocation(program, "vertex")
         glEnableVertexAttribArray(var)
-        self.text_vbo.fill(self.vertcoords)
-        self.text_vbo.bind()
-        glVertexAttribPointer(var, 2, GL_FLOAT, False, 0, None)
-        self.text_vbo.unbind()
+        glVertexAttribPointer(var, 2, GL_FLOAT, False, stride, None)
 
         # textures coordinates
         var = glGetAttribLocation(program, "texcoord")
         glEnableVertexAttribArray(var)
-        self.text_tbo.fill(self.texcoords)
-        self.text_tbo.bind()
-        glVertexAttribPointer(var, 2, GL_FLOAT, False, 0, None)
-        self.text_tbo.unbind()
+        offset = ctypes.c_void_p(2 * 4)
+        glVertexAttribPointer(var, 2, GL_FLOAT, False, stride, offset)
+
+        self.text_buffer.unbind()
 
         # actually draw
         self.set_color(1, 1, 1, 1)
         glBindTexture(GL_TEXTURE_2D, self.font)
-        glDrawArrays(GL_TRIANGLES, 0, self.text_vbo.size // 2)
+        glDrawArrays(GL_TRIANGLES, 0, self.text_buffer.size // 4)
         glBindTexture(GL_TEXTURE_2D, 0)
 
         # restore state
@@ -158,6 +195,7 @@ class HUD(gspyce.scene.Scene):
     @glut_callback
     def displayFunc(self):
         """Draw the screen (GLUT callback)"""
+        self.redisplay_done()
         self.set_and_draw()
         self.set_and_draw_hud()
         glutSwapBuffers()
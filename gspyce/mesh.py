@@ -1,37 +1,82 @@
+import ctypes
+import itertools
 import math
 
 from spyce.vector import Vec4, Mat4
 from gspyce.graphics import *
 
 
+# points of the base shapes, without any GL object, for meshes that transform
+# them (see OrbitMesh and FocusedOrbitMesh)
+
+def circle_points(radius, points):
+    """Circle centered on (0, 0, 0) with axis (0, 0, 1)"""
+    for i in range(points):
+        x = 2*i/points - 1  # from -1.0 to +1.0
+        theta = math.pi * x
+        yield (
+            radius * math.cos(theta),
+            radius * math.sin(theta),
+        )
+
+
+def circle_through_origin_points(radius, points):
+    """Circle centered on (radius, 0, 0) with axis (0, 0, 1)"""
+    for i in range(points):
+        x = 2*i/points - 1  # from -1.0 to +1.0
+        theta = math.pi * x**3
+        yield (
+            radius * (1 - math.cos(theta)),
+            radius * math.sin(theta),
+        )
+
+
+def parabola_points(points):
+    """Parabola"""
+    for i in range(points):
+        x = 2*i/(points-1) - 1  # from -1.0 to +1.0
+        theta = math.pi * x
+        yield math.cosh(theta), math.sinh(theta)
+
+
 class Mesh:
     """A 2D or 3D mesh"""
     bound_mesh = None
 
-    def __init__(self, mode):
+    def __init__(self, mode, usage=GL_STATIC_DRAW):
         """Create a new mesh
 
-        A Vertex Buffer Object is filled with data from self.vertices()
-        A Texcoord Buffer Object is filled with data from self.texcoords()
-        A Normal Buffer Object is filled with data from self.normals()
+        A single Vertex Buffer Object is filled with data from
+        self.vertices(), interleaved with self.texcoords() and self.normals()
+        when they are defined
         Mesh will be drawn using given OpenGL mode (GL_TRIANGLES, etc.)
+        `usage` is passed to the buffer object (see BufferObject)
         """
         # save meta-data
         self.mode = mode
+
+        # create buffer object
+        self.vertex_buffer = BufferObject(usage=usage)
+
+        self.update()
+
+    def update(self):
+        """Refill the buffer object (e.g. after the vertices changed)"""
         vertices = list(self.vertices())
         self.length = len(vertices)
         self.components = len(vertices[0])
 
-        # fill vertex buffer object
-        self.vertex_buffer = BufferObject(vertices, flatten=True)
-
-        # fill texcoord buffer object
+        # interleave the attributes of each vertex
+        attributes = [vertices]
         if hasattr(self, "texcoords"):
-            self.texcoord_buffer = BufferObject(self.texcoords(), flatten=True)
-
-        # fill normal buffer boject
+            attributes.append(self.texcoords())
         if hasattr(self, "normals"):
-            self.normal_buffer = BufferObject(self.normals(), flatten=True)
+            attributes.append(self.normals())
+        if len(attributes) > 1:
+            data = itertools.chain.from_iterable(zip(*attributes))
+        else:
+            data = vertices
+        self.vertex_buffer.fill(data, flatten=True)
 
     def bind(self):
         """"Bind the mesh for glDrawArrays()
@@ -46,30 +91,41 @@ class Mesh:
 
         program = glGetIntegerv(GL_CURRENT_PROGRAM)
 
-        # select vertex buffer object
+        # layout of a vertex in the buffer object (in floats)
+        offset = self.components
+        stride = self.components
+        if hasattr(self, "texcoords"):
+            stride += 2
+        if hasattr(self, "normals"):
+            stride += 3
+        stride *= 4  # bytes
+
+        self.vertex_buffer.bind()
+
+        # select vertex attribute
         var = glGetAttribLocation(program, "vertex")
         glEnableVertexAttribArray(var)
-        self.vertex_buffer.bind()
-        glVertexAttribPointer(var, self.components, GL_FLOAT, False, 0, None)
-        self.vertex_buffer.unbind()
+        glVertexAttribPointer(var, self.components, GL_FLOAT, False, stride,
+                              None)
 
-        # select texcoord buffer object
-        if hasattr(self, "texcoord_buffer"):
+        # select texcoord attribute
+        if hasattr(self, "texcoords"):
             var = glGetAttribLocation(program, "texcoord")
             if var != -1:  # active attribute
                 glEnableVertexAttribArray(var)
-                self.texcoord_buffer.bind()
-                glVertexAttribPointer(var, 2, GL_FLOAT, False, 0, None)
-                self.texcoord_buffer.unbind()
+                glVertexAttribPointer(var, 2, GL_FLOAT, False, stride,
+                                      ctypes.c_void_p(offset*4))
+            offset += 2
 
-        # select normal buffer object
-        if hasattr(self, "normal_buffer"):
+        # select normal attribute
+        if hasattr(self, "normals"):
             var = glGetAttribLocation(program, "normal")
             if var != -1:  # active attribute
                 glEnableVertexAttribArray(var)
-                self.normal_buffer.bind()
-                glVertexAttribPointer(var, 3, GL_FLOAT, False, 0, None)
-                self.normal_buffer.unbind()
+                glVertexAttribPointer(var, 3, GL_FLOAT, False, stride,
+                                      ctypes.c_void_p(offset*4))
+
+        self.vertex_buffer.unbind()
 
         return False
 
@@ -96,9 +152,14 @@ class Mesh:
 
 
 class Generic(Mesh):
-    def __init__(self, mode, vertices):
+    def __init__(self, mode, vertices, usage=GL_STATIC_DRAW):
         self.vertices_ = vertices
-        super().__init__(mode)
+        super().__init__(mode, usage)
+
+    def set_vertices(self, vertices):
+        """Replace the vertices of the mesh (reuse the buffer objects)"""
+        self.vertices_ = vertices
+        self.update()
 
     def vertices(self):
         yield from self.vertices_
@@ -181,13 +242,7 @@ class Circle(Mesh):
         super().__init__(GL_LINE_LOOP)
 
     def vertices(self):
-        for i in range(self.points):
-            x = 2*i/self.points - 1  # from -1.0 to +1.0
-            theta = math.pi * x
-            yield (
-                self.radius * math.cos(theta),
-                self.radius * math.sin(theta),
-            )
+        return circle_points(self.radius, self.points)
 
 
 class CircleThroughOrigin(Mesh):
@@ -198,13 +253,7 @@ class CircleThroughOrigin(Mesh):
         super().__init__(GL_LINE_LOOP)
 
     def vertices(self):
-        for i in range(self.points):
-            x = 2*i/self.points - 1  # from -1.0 to +1.0
-            theta = math.pi * x**3
-            yield (
-                self.radius * (1 - math.cos(theta)),
-                self.radius * math.sin(theta),
-            )
+        return circle_through_origin_points(self.radius, self.points)
 
 
 class Parabola(Mesh):
@@ -214,10 +263,7 @@ class Parabola(Mesh):
         super().__init__(GL_LINE_STRIP)
 
     def vertices(self):
-        for i in range(self.points):
-            x = 2*i/(self.points-1) - 1  # from -1.0 to +1.0
-            theta = math.pi * x
-            yield math.cosh(theta), math.sinh(theta)
+        return parabola_points(self.points)
 
 
 class OrbitMesh(Mesh):
@@ -236,10 +282,10 @@ class OrbitMesh(Mesh):
             Mat4.scale(orbit.semi_major_axis, orbit.semi_minor_axis, 1.0)
         )
         if orbit.eccentricity < 1.:
-            base_mesh = Circle(1, 512)
+            base_vertices = circle_points(1, 512)
         else:
-            base_mesh = Parabola(256)
-        for vertice in base_mesh.vertices():
+            base_vertices = parabola_points(256)
+        for vertice in base_vertices:
             yield transform @ Vec4(*vertice)
 
 
@@ -271,11 +317,24 @@ class ApsesMesh(Mesh):
 
 
 class FocusedOrbitMesh(Mesh):
+    # base shape of closed orbits; computed once since refocus() is called
+    # every frame, and without a Mesh, which would allocate a buffer object
+    base_vertices = tuple(circle_through_origin_points(1, 256))
+
     def __init__(self, orbit, time):
         self.orbit = orbit
         self.time = time
         mode = GL_LINE_LOOP if orbit.eccentricity < 1. else GL_LINE_STRIP
-        super().__init__(mode)
+        super().__init__(mode, GL_DYNAMIC_DRAW)
+
+    def refocus(self, orbit, time):
+        """Update the mesh in place for the given orbit and time
+
+        Reuses the buffer objects instead of allocating new ones each frame"""
+        self.orbit = orbit
+        self.time = time
+        self.mode = GL_LINE_LOOP if orbit.eccentricity < 1. else GL_LINE_STRIP
+        self.update()
 
     def vertices(self):
         orbit = self.orbit
@@ -326,8 +385,7 @@ class FocusedOrbitMesh(Mesh):
 
             # the first point of circle_through_origin is (0,0) (2.)
             # more points are located near the origin (3.)
-            base_mesh = CircleThroughOrigin(1, 256)
-            for vertice in base_mesh.vertices():
+            for vertice in self.base_vertices:
                 yield transform @ Vec4(*vertice)
 
 
@@ -335,7 +393,15 @@ class FocusedApsesMesh(Mesh):
     def __init__(self, orbit, time):
         self.orbit = orbit
         self.time = time
-        super().__init__(GL_POINTS)
+        super().__init__(GL_POINTS, GL_DYNAMIC_DRAW)
+
+    def refocus(self, orbit, time):
+        """Update the mesh in place for the given orbit and time
+
+        See FocusedOrbitMesh.refocus()"""
+        self.orbit = orbit
+        self.time = time
+        self.update()
 
     def vertices(self):
         focus_offset = self.orbit.position_at_time(self.time)
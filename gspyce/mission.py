@@ -1,4 +1,3 @@
-import time
 from math import radians
 
 from spyce.vector import Mat4
@@ -16,25 +15,29 @@ class MissionGUI(gspyce.simulation.SimulationGUI):
         self.texture_rocket_on = gspyce.textures.load("rocket_on.png")
         self.texture_rocket_off = gspyce.textures.load("rocket_off.png")
 
+        # simulation time not yet simulated
+        self.accumulated_time = 0.
+        self.physics_step = 2.**-5
+
     def draw_rocket(self):
         """Draw the rocket"""
 
         self.add_pick_object(self.rocket)
 
-        # rocket orientation
-        row1, row2, row3 = self.rocket.orientation
-        orientation = Mat4([
-            [*row1, 0],
-            [*row2, 0],
-            [*row3, 0],
+        # translation, scaling and orientation of the rocket, directly
+        # composed as a single matrix
+        x, y, z = self.rocket._relative_position
+        s = 1e4
+        (a, b, c), (d, e, f), (g, h, i) = self.rocket.orientation
+        model = Mat4([
+            [s*a, s*b, s*c, x],
+            [s*d, s*e, s*f, y],
+            [s*g, s*h, s*i, z],
             [0, 0, 0, 1],
         ])
 
         original_modelview_matrix = self.modelview_matrix
-        transform = self.modelview_matrix @ \
-            Mat4.translate(*self.rocket._relative_position) @ \
-            Mat4.scale(1e4, 1e4, 1e4) @ \
-            orientation
+        transform = self.modelview_matrix @ model
         self.set_modelview_matrix(transform)
 
         # pick correct texture
@@ -66,45 +69,33 @@ class MissionGUI(gspyce.simulation.SimulationGUI):
 
         self.draw_rocket()
 
-    def main(self):
-        """Main loop"""
-        last = time.time()
-        accumulated_time = 0.
-        while self.is_running:
-            glutMainLoopEvent()
-
-            # passage of time
-            now = time.time()
-            elapsed = now - last
-            last = now
-            accumulated_time += elapsed * self.timewarp
-
-            dt = 2.**-5
-
-            # avoid wasting cycles
-            if accumulated_time < dt:
-                pause = 1./60 - elapsed
-                if pause > 0.:
-                    time.sleep(pause)
-                continue
-
-            # physics simulation
-            while accumulated_time > dt:
-                if self.rocket.throttle:
-                    # physical simulation (integration)
-                    delta_t = dt
-                else:
-                    # logical simulation (just following Kepler orbits)
-                    resume_delay = self.rocket.resume_time - self.time
-                    next_activity = max(dt, resume_delay)
-                    delta_t = (min(accumulated_time, next_activity) // dt) * dt
-                accumulated_time -= delta_t
-                self.rocket.simulate(self.time, delta_t)
-                self.time += delta_t
-
-            self.update()
-
-        glutCloseFunc(None)
+    def simulate(self, elapsed):
+        """Advance the simulation by `elapsed` seconds (simulation time)"""
+        accumulated_time = self.accumulated_time + elapsed
+
+        # physics simulation
+        dt = self.physics_step
+        while accumulated_time > dt:
+            if self.rocket.throttle:
+                # physical simulation (integration)
+                delta_t = dt
+            else:
+                # logical simulation (just following Kepler orbits)
+                resume_delay = self.rocket.resume_time - self.time
+                next_activity = max(dt, resume_delay)
+                delta_t = (min(accumulated_time, next_activity) // dt) * dt
+            accumulated_time -= delta_t
+            self.rocket.simulate(self.time, delta_t)
+            self.time += delta_t
+
+        self.accumulated_time = accumulated_time
+
+    def simulation_delay(self):
+        """Delay (s) before the simulation should be advanced again"""
+        # wake up when the next physics step is due, rather than polling
+        missing_time = self.physics_step - self.accumulated_time
+        delay = missing_time / self.timewarp
+        return max(0., min(delay, self.frame_interval))
 
 
 def main():
@@ -66,9 +66,8 @@ class PickingGUI(gspyce.hud.HUD):
         self.picking_enabled = False
         self.set_color(*original_color)
 
-        # invert y axis
-        viewport = glGetIntegerv(GL_VIEWPORT)
-        y = viewport[3] - y
+        # invert y axis (the viewport covers the window, see reshapeFunc())
+        y = self.height - y
 
         # retrieve names
         search_radius = 30
@@ -1,4 +1,5 @@
 import sys
+import time
 from math import radians
 
 from spyce.vector import Mat4
@@ -19,6 +20,11 @@ class Scene:
         self.phi = -90
         self.is_running = True  # set to False for soft exit
 
+        # redisplay coalescing (see update())
+        self.frame_interval = 1/60  # s
+        self.redisplay_pending = False
+        self.last_redisplay = 0.
+
         # GLUT init
         glutInit(sys.argv)
         glutInitContextVersion(3, 0)  # 2.0 enough, 3.0 = forward compatiblity
@@ -31,6 +37,9 @@ class Scene:
         glutCreateWindow(title)
         self.fullscreen = False
 
+        # avoid tearing and rendering frames that would never be displayed
+        set_swap_interval(1)
+
         # callbacks
         glutDisplayFunc(self.displayFunc)
         glutKeyboardFunc(self.keyboardFunc)
@@ -51,8 +60,9 @@ class Scene:
 
         # use of VAO is required by OpenGL 3.2 core, so we use one if available
         if bool(glGenVertexArrays):  # OpenGL 3.0
+            # a single VAO is shared by all meshes; they set their attribute
+            # pointers when bound
             vao = glGenVertexArrays(1)
-            glEnableVertexAttribArray(vao)
             glBindVertexArray(vao)
 
         # initialize textures
@@ -122,6 +132,7 @@ class Scene:
     @glut_callback
     def displayFunc(self):
         """Draw the screen (GLUT callback)"""
+        self.redisplay_done()
         self.set_and_draw()
         glutSwapBuffers()
 
@@ -224,7 +235,27 @@ class Scene:
         glutLeaveMainLoop()
 
     def update(self):
-        """Force an update of the screen"""
+        """Request an update of the screen
+
+        Requests are coalesced until the screen is actually redrawn, and
+        redraws are spaced by at least `frame_interval` seconds."""
+        if self.redisplay_pending:
+            return
+        self.redisplay_pending = True
+        delay = self.last_redisplay + self.frame_interval - time.perf_counter()
+        if delay > 0:
+            glutTimerFunc(int(delay*1000), self.redisplayTimerFunc, 0)
+        else:
+            glutPostRedisplay()
+
+    def redisplay_done(self):
+        """Acknowledge requests for updates when the screen is redrawn"""
+        self.redisplay_pending = False
+        self.last_redisplay = time.perf_counter()
+
+    @glut_callback
+    def redisplayTimerFunc(self, value):
+        """Post a delayed redisplay (GLUT callback)"""
         glutPostRedisplay()
 
     def main(self):
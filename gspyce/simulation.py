@@ -1,3 +1,4 @@
+import math
 import time
 import collections
 
@@ -35,7 +36,7 @@ class SimulationGUI(gspyce.system.SystemGUI):
     def keyboardFunc(self, k, x, y):
         """Handle key presses (GLUT callback)"""
         if k == b'\x1b':  # escape
-            self.is_running = False
+            self.quit()
         elif k == b',':
             self.timewarp /= 10
             self.update()
@@ -45,18 +46,42 @@ class SimulationGUI(gspyce.system.SystemGUI):
         else:
             super().keyboardFunc(k, x, y)
 
-    def main(self):
-        """Main loop"""
-        last = time.time()
-        while self.is_running:
-            # passage of time
-            now = time.time()
-            elapsed = now - last
-            last = now
-            self.time += elapsed * self.timewarp
+    def simulate(self, elapsed):
+        """Advance the simulation by `elapsed` seconds (simulation time)"""
+        self.time += elapsed
 
+    def simulation_delay(self):
+        """Delay (s) before the simulation should be advanced again"""
+        # no need to advance time faster than the screen is redrawn
+        return self.frame_interval
+
+    @glut_callback
+    def physicsTimerFunc(self, value):
+        """Advance the simulation (GLUT callback)"""
+        # passage of time
+        now = time.perf_counter()
+        elapsed = now - self.last_physics_update
+        self.last_physics_update = now
+        previous_time = self.time
+        self.simulate(elapsed * self.timewarp)
+
+        # redraw when the state changed (update() caps the frame rate)
+        if self.time != previous_time:
             self.update()
-            glutMainLoopEvent()
+
+        # re-arm the timer for when there is work to do
+        if self.is_running:
+            # rounded up: GLUT counts in ms, and a 0 ms delay would poll
+            delay = max(1, math.ceil(self.simulation_delay() * 1000))
+            glutTimerFunc(delay, self.physicsTimerFunc, value)
+
+    def main(self):
+        """Main loop"""
+        # the simulation runs at its own pace, events and redraws are handled
+        # by glutMainLoop() in-between
+        self.last_physics_update = time.perf_counter()
+        glutTimerFunc(0, self.physicsTimerFunc, 0)
+        super().main()
 
         glutCloseFunc(None)
 
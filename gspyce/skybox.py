@@ -5,48 +5,68 @@ import gspyce.textures
 class Skybox:
     """Simulate the sky with a textured box"""
 
+    # the cubemap is sampled using the direction of the fragment, so the box
+    # only needs its 8 corners; faces are then described by indices
+    size = 10
+    corners = (
+        (-1, -1, -1), (-1, -1, +1), (-1, +1, -1), (-1, +1, +1),
+        (+1, -1, -1), (+1, -1, +1), (+1, +1, -1), (+1, +1, +1),
+    )
+    indices = (
+        7, 6, 5, 5, 6, 4,  # +X
+        1, 0, 3, 3, 0, 2,  # -X
+        3, 2, 7, 7, 2, 6,  # +Y
+        5, 4, 1, 1, 4, 0,  # -Y
+        7, 5, 3, 3, 5, 1,  # +Z
+        6, 2, 4, 4, 2, 0,  # -Z
+    )
+
     def __init__(self, *path):
         """Create a skybox
 
         Arguments are joined together to make the paths to the textures. Last
         argument should be a pattern with a "%s", which will be completed as
-        "PositiveX", "NegativeY" and so on."""
+        "PositiveX", "NegativeY" and so on.
+
+        The skybox comes with its own shader program, `program`, which
+        samples the cubemap in the direction of each fragment."""
 
         self.texture = gspyce.textures.load_cubemap(*path)
-        s = 10
-        vertices = [
-            # +X
-            (+s, +s, +s), (+s, +s, -s), (+s, -s, +s),
-            (+s, -s, +s), (+s, +s, -s), (+s, -s, -s),
-            # -X
-            (-s, -s, +s), (-s, -s, -s), (-s, +s, +s),
-            (-s, +s, +s), (-s, -s, -s), (-s, +s, -s),
-            # +Y
-            (-s, +s, +s), (-s, +s, -s), (+s, +s, +s),
-            (+s, +s, +s), (-s, +s, -s), (+s, +s, -s),
-            # -Y
-            (+s, -s, +s), (+s, -s, -s), (-s, -s, +s),
-            (-s, -s, +s), (+s, -s, -s), (-s, -s, -s),
-            # +Z
-            (+s, +s, +s), (+s, -s, +s), (-s, +s, +s),
-            (-s, +s, +s), (+s, -s, +s), (-s, -s, +s),
-            # -Z
-            (+s, +s, -s), (-s, +s, -s), (+s, -s, -s),
-            (+s, -s, -s), (-s, +s, -s), (-s, -s, -s),
-        ]
+
+        # set up shader program once and for all
+        self.program = main_program("cubemap")
+        var = glGetUniformLocation(self.program, b"cubemap_texture")
+        current_program = glGetIntegerv(GL_CURRENT_PROGRAM)
+        glUseProgram(self.program)
+        glUniform1i(var, 0)  # first texture unit
+        glUseProgram(current_program)
+        self.vertex_attribute = glGetAttribLocation(self.program, "vertex")
+
+        # upload the box once and for all
+        s = self.size
+        vertices = [(s*x, s*y, s*z) for x, y, z in self.corners]
         self.vertex_buffer = BufferObject(vertices, flatten=True)
 
+        self.length = len(self.indices)
+        self.index_buffer = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.index_buffer)
+        indices_buffer = (ctypes.c_ushort*self.length)(*self.indices)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices_buffer, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
     def draw(self):
-        """Draw a skybox of given size"""
+        """Draw the skybox (`program` must be in use)"""
         glBindTexture(GL_TEXTURE_CUBE_MAP, self.texture)
 
         self.vertex_buffer.bind()
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.index_buffer)
 
-        program = glGetIntegerv(GL_CURRENT_PROGRAM)
-        var = glGetAttribLocation(program, "vertex")
+        var = self.vertex_attribute
         glEnableVertexAttribArray(var)
         glVertexAttribPointer(var, 3, GL_FLOAT, False, 0, None)
-        glDrawArrays(GL_TRIANGLES, 0, 36)
+        glDrawElements(GL_TRIANGLES, self.length, GL_UNSIGNED_SHORT, None)
         glDisableVertexAttribArray(var)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
         self.vertex_buffer.unbind()
         glBindTexture(GL_TEXTURE_CUBE_MAP, 0)
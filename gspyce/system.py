@@ -73,15 +73,16 @@ class SystemGUI(gspyce.picking.PickingGUI, gspyce.terminal.TerminalGUI):
             glGetUniformLocation(self.shader_lighting, b'lighting_source')
 
         # skybox
-        self.shader_skybox = main_program('cubemap')
-        self.shader_set(self.shader_skybox)
-        var = glGetUniformLocation(self.shader_skybox, b"cubemap_texture")
-        glUniform1i(var, 0)
         self.skybox = gspyce.skybox.Skybox("skybox", "GalaxyTex_%s.jpg")
+        self.shader_skybox = self.skybox.program
 
         # sphere VBO for drawing bodies
         self.sphere = gspyce.mesh.Sphere(1, 64, 64)
 
+        # markers for the positions of bodies (refilled every frame)
+        self.position_markers = gspyce.mesh.Generic(
+            GL_POINTS, [(0, 0, 0)], GL_DYNAMIC_DRAW)
+
         # meshes for drawing orbits
         self.circle_through_origin = gspyce.mesh.CircleThroughOrigin(1, 256)
 
@@ -207,7 +208,8 @@ class SystemGUI(gspyce.picking.PickingGUI, gspyce.terminal.TerminalGUI):
         self.set_color(1, 0, 0, 0.5)
         self.clear_pick_object()
         points = (body._relative_position for body in bodies)
-        gspyce.mesh.Generic(GL_POINTS, points).draw()
+        self.position_markers.set_vertices(points)
+        self.position_markers.draw()
         self.shader_set()
         glDepthMask(True)
 
@@ -242,8 +244,16 @@ class SystemGUI(gspyce.picking.PickingGUI, gspyce.terminal.TerminalGUI):
                 Mat4.translate(*body._relative_position)
             )
             self.add_pick_object(body)
-            gspyce.mesh.FocusedOrbitMesh(body.orbit, self.time).draw()
-            gspyce.mesh.FocusedApsesMesh(body.orbit, self.time).draw()
+            if not hasattr(body, "focused_orbit_mesh"):
+                body.focused_orbit_mesh = \
+                    gspyce.mesh.FocusedOrbitMesh(body.orbit, self.time)
+                body.focused_apses_mesh = \
+                    gspyce.mesh.FocusedApsesMesh(body.orbit, self.time)
+            else:
+                body.focused_orbit_mesh.refocus(body.orbit, self.time)
+                body.focused_apses_mesh.refocus(body.orbit, self.time)
+            body.focused_orbit_mesh.draw()
+            body.focused_apses_mesh.draw()
             self.set_modelview_matrix(original_modelview_matrix)
 
     def set_and_draw(self):
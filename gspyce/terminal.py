@@ -3,7 +3,6 @@ import sys  # version_info, platform
 import tty  # setraw
 import pty  # openpty
 import code  # interact
-import time  # sleep
 import termios  # save and restore attributes
 import threading  # Thread
 import collections  # deque
@@ -160,7 +159,11 @@ class TerminalGUI(gspyce.hud.HUD):
     """GUI with an interactive text terminal"""
     def __init__(self, title=b"Terminal in GUI"):
         super().__init__(title)
-        glutIdleFunc(self.idleFunc)
+
+        # poll the REPL pipes periodically rather than spinning in an idle
+        # callback, so that GLUT can sleep while waiting for events
+        self.terminal_poll_interval = 10  # ms
+        glutTimerFunc(self.terminal_poll_interval, self.terminalTimerFunc, 0)
 
         # terminal controls
         self.terminal_enabled = False
@@ -325,7 +328,8 @@ class TerminalGUI(gspyce.hud.HUD):
             self.terminal_restore_specialFunc(k, x, y)
 
     @glut_callback
-    def idleFunc(self):
+    def terminalTimerFunc(self, value):
+        """Forward pending terminal I/O (GLUT callback)"""
         try:
             self.flush_pipes()
         except:
@@ -333,7 +337,10 @@ class TerminalGUI(gspyce.hud.HUD):
             self.stop_redirection()
             raise
 
-        time.sleep(.01)
+        # re-arm the timer
+        if self.is_running:
+            glutTimerFunc(self.terminal_poll_interval,
+                          self.terminalTimerFunc, value)
 
     def draw_hud(self):
         """Draw the HUD"""
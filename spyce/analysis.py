@@ -26,19 +26,20 @@ def newton_raphson(x_0, f=None, f_prime=None, ratio=None):
     instead.
     """
     # handle arguments
-    if ratio is None:
-        def ratio(x):
-            return f(x) / f_prime(x)
-    else:
-        if f is not None or f_prime is not None:
-            raise TypeError('specify either ratio or (f and f_prime)')
+    if ratio is not None and (f is not None or f_prime is not None):
+        raise TypeError('specify either ratio or (f and f_prime)')
 
     # run Newton-Raphson
+    # f and f_prime are called directly rather than through a wrapping
+    # closure, which would add a function call to each iteration
     x = x_0
     previous_x = 0
     for _ in range(30):  # upper limit on iteration count
         previous_previous_x, previous_x = previous_x, x
-        x -= ratio(x)
+        if ratio is None:
+            x -= f(x) / f_prime(x)
+        else:
+            x -= ratio(x)
         if x in (previous_x, previous_previous_x):
             # best accuracy reached
             break
@@ -5,6 +5,18 @@ from spyce.vector import Vec3
 import spyce.physics
 
 
+# see CelestialBody.str2time()
+TIME_REGEX = re.compile(
+    r"([-+]?)"  # sign
+    r"(?:(\d+)y[\s,]*)?"  # years
+    r"(?:(\d+)d[\s,]*)?"  # days
+    r"(?:"
+    r"(\d+):(\d+)"  # hours:minutes
+    r"(?::(\d+(?:\.\d+)?))?"  # :seconds.fraction
+    r")?"
+)
+
+
 class InvalidConstellation(Exception):
     pass
 
@@ -16,6 +28,9 @@ class CelestialBody:
     It includes a few handy methods to plan orbital travel.
     """
 
+    # (time, orbit, position) of the last call to global_position_at_time()
+    _global_position_cache = (None, None, None)
+
     def __init__(self, name, gravitational_parameter=0, radius=0,
                  rotational_period=0, north_pole=None, orbit=None, **_):
         """Definition of a celestial body
@@ -105,11 +120,28 @@ class CelestialBody:
         return self.name
 
     def global_position_at_time(self, time):
-        """Global position of the celestial body within the stellar system"""
-        if self.orbit is None:
-            return Vec3([0, 0, 0])
-        primary_position = self.orbit.primary.global_position_at_time(time)
-        return primary_position + self.orbit.position_at_time(time)
+        """Global position of the celestial body within the stellar system
+
+        The last result of each body is cached, so that computing the
+        positions of all the bodies of a system at a given time only computes
+        the position of each body on its orbit once."""
+        # climb up to the first ancestor whose position is known
+        unknown = []
+        body = self
+        while body.orbit is not None:
+            cached_time, cached_orbit, position = body._global_position_cache
+            if cached_time == time and cached_orbit is body.orbit:
+                break
+            unknown.append(body)
+            body = body.orbit.primary
+        else:
+            position = Vec3([0, 0, 0])
+
+        # go back down, adding the positions relative to the primaries
+        for body in reversed(unknown):
+            position = position + body.orbit.position_at_time(time)
+            body._global_position_cache = time, body.orbit, position
+        return position
 
     def gravity(self, distance=None):
         """Gravity at given distance from center
@@ -135,29 +167,21 @@ class CelestialBody:
 
         See str2time()
         """
-        sign = "-" if seconds < 0 else "+"
-        seconds = abs(float(seconds))
+        sign = "-+"[seconds >= 0]
+        seconds = abs(seconds)
         y, seconds = divmod(seconds, self.orbit.period)
         d, seconds = divmod(seconds, self.rotational_period)
         h, seconds = divmod(seconds, 3600)
         m, seconds = divmod(seconds, 60)
-        return sign + "%.5gy,%4ud,%3u:%02u:%04.1f" % (y, d, h, m, seconds)
+        d, h, m = int(d), int(h), int(m)
+        return f"{sign}{y:.5g}y,{d:4d}d,{h:3d}:{m:02d}:{seconds:04.1f}"
 
     def str2time(self, formatted_time):
         """Extract a duration (s) from formated time
 
         See time2str()
         """
-        regex = re.compile(
-            r"([-+]?)"  # sign
-            r"(?:(\d+)y[\s,]*)?"  # years
-            r"(?:(\d+)d[\s,]*)?"  # days
-            r"(?:"
-            r"(\d+):(\d+)"  # hours:minutes
-            r"(?::(\d+(?:\.\d+)?))?"  # :seconds.fraction
-            r")?"
-        )
-        match = regex.match(formatted_time)
+        match = TIME_REGEX.match(formatted_time)
         groups = match.groups()
         y, d, h, m, s = (float(group) if group else 0 for group in groups[1:])
 
@@ -178,6 +178,7 @@ double eccentric_anomaly_at_mean_anomaly(double e, double M)
 {
 	/* Computes the eccentric anomaly at a given mean anomaly */
 
+	// same algorithms as OrbitGeometry.eccentric_anomaly_at_mean_anomaly()
 	if (e < 1.)
 	{
 		// M %= 2*PI
@@ -189,28 +190,47 @@ double eccentric_anomaly_at_mean_anomaly(double e, double M)
 		if (fabs(M) < 1.4901161193847656e-08)  // 2**-26
 			return M / (1. - e);
 
-		// M = E - e sin E
-		double E = M_PI;
-		inline double f     (double E) { return E - e*sin(E) - M; }
-		inline double fprime(double E) { return 1. - e*cos(E); }
-
-		// Newton's method
-		double previous_E = 0.;
-		for (int i = 0; i < 30; i++)
+		// nearly circular orbits: series in e refined by one Newton step
+		if (e < 0.015625)  // 2**-6
 		{
-			double previous_previous_E = previous_E;
-			previous_E = E;
-			E -= f(E) / fprime(E);
-			if (E == previous_E || E == previous_previous_E)
-				break;
+			double sM = sin(M);
+			double cM = cos(M);
+			double E = M + e*sM*(1. + e*cM + e*e*(1. - 1.5*sM*sM));
+			return E - (E - e*sin(E) - M) / (1. - e*cos(E));
 		}
 
+		// Markley's starter on [-pi, pi]
+		if (M > M_PI)
+			M -= 2.*M_PI;
+		double pi2 = M_PI*M_PI;
+		double alpha = (3.*pi2 + 1.6*M_PI*(M_PI-fabs(M))/(1.+e)) / (pi2-6.);
+		double d = 3.*(1.-e) + alpha*e;
+		double q = 2.*alpha*d*(1.-e) - M*M;
+		double r = 3.*alpha*d*(d-1.+e)*M + M*M*M;
+		double w = pow(fabs(r) + sqrt(q*q*q + r*r), 2./3.);
+		double E = (2.*r*w/(w*w + w*q + q*q) + M) / d;
+
+		// single fifth-order correction
+		double es = e*sin(E);
+		double ec = e*cos(E);
+		double f0 = E - es - M;
+		double f1 = 1. - ec;
+		double d3 = -f0 / (f1 - f0*es/(2.*f1));
+		double d4 = -f0 / (f1 + d3*es/2. + d3*d3*ec/6.);
+		double d5 = -f0 / (f1 + d4*es/2. + d4*d4*ec/6. - d4*d4*d4*es/24.);
+		E = fmod(E + d5, 2.*M_PI);
+		if (E < 0)
+			E += 2.*M_PI;
 		return E;
 	}
 	else if (e == 1.)
 	{
-		double z = pow(M + sqrt(M*M+1), 1./3);
-		return z - 1/z;
+		// Barker's equation, solved with Cardano's formula
+		// E = z - 1/z with z^3 = M + sqrt(M^2 + 1), computed as
+		// 2M / (z^2 + 1 + 1/z^2) for positive M since the equation is odd
+		double z = cbrt(fabs(M) + hypot(M, 1.));
+		double z2 = z*z;
+		return copysign(2.*fabs(M) / (z2 + 1. + 1./z2), M);
 	}
 	else
 	{
@@ -218,23 +238,35 @@ double eccentric_anomaly_at_mean_anomaly(double e, double M)
 		if (fabs(M) < 1.4901161193847656e-08)  // 2**-26
 			return M / (e - 1.);
 
-		// M = e sinh E - E
-		double E = 1.;
-		inline double f     (double E) { return e*sinh(E) - E - M; }
-		inline double fprime(double E) { return e*cosh(E) - 1.; }
+		// the equation is odd in E; solve for positive M only
+		double sign = M < 0. ? -1. : 1.;
+		M = fabs(M);
 
-		// Newton's method
-		double previous_E = 0.;
+		// initial guess from upper bounds of the solution
+		double E = min(M/(e-1.), cbrt(6.*M/e));
+		E = min(E, log(2.*M/e + 1.8));
+
+		// Danby's third-order iteration
+		double previous_step = INFINITY;
 		for (int i = 0; i < 30; i++)
 		{
-			double previous_previous_E = previous_E;
-			previous_E = E;
-			E -= f(E) / fprime(E);
-			if (E == previous_E || E == previous_previous_E)
+			double es = e*sinh(E);
+			double ec = sqrt(e*e + es*es);  // e cosh E
+			double f0 = es - E - M;
+			double f1 = ec - 1.;
+			double d1 = -f0 / f1;
+			double d2 = -f0 / (f1 + d1*es/2.);
+			double d3 = -f0 / (f1 + d2*es/2. + d2*d2*ec/6.);
+			double step = fabs(d3);
+			if (step >= previous_step)
+				break;  // rounding errors dominate
+			E += d3;
+			if (step <= 8.881784197001252e-16 * E)  // 2**-50
 				break;
+			previous_step = step;
 		}
 
-		return E;
+		return sign * E;
 	}
 }
 
@@ -280,8 +312,8 @@ double true_anomaly_at_eccentric_anomaly(double e, double E)
 	}
 	else
 	{
-		double x = sqrt(e-1.) * cosh(E/2.);
-		double y = sqrt(e+1.) * sinh(E/2.);
-		return 2. * atan2(y, x);
+		// tan(v/2) = sqrt((e+1)/(e-1)) tanh(E/2); no overflow of cosh()
+		double k = sqrt((e+1.)/(e-1.));
+		return 2. * atan(k * tanh(E/2.));
 	}
 }
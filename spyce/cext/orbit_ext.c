@@ -89,6 +89,68 @@ static PyObject* wrapper_true_anomaly_at_eccentric_anomaly(PyObject* self, PyObj
 }
 
 
+static PyObject* anomalies_at_times(PyObject* args, double (*at_mean_anomaly)(double, double))
+{
+	/* Apply at_mean_anomaly() to the mean anomaly at each of given times */
+
+	double eccentricity;
+	double mean_anomaly_at_epoch;
+	double mean_motion;
+	double epoch;
+	PyObject* times;
+
+	if (!PyArg_ParseTuple(args, "ddddO", &eccentricity,
+		&mean_anomaly_at_epoch, &mean_motion, &epoch, &times
+	))
+		return NULL;
+
+	PyObject* sequence = PySequence_Fast(times, "times must be iterable");
+	if (sequence == NULL)
+		return NULL;
+
+	Py_ssize_t n = PySequence_Fast_GET_SIZE(sequence);
+	PyObject** items = PySequence_Fast_ITEMS(sequence);
+	PyObject* ret = PyList_New(n);
+	if (ret == NULL)
+	{
+		Py_DECREF(sequence);
+		return NULL;
+	}
+
+	for (Py_ssize_t i = 0; i < n; i++)
+	{
+		double time = PyFloat_AsDouble(items[i]);
+		if (time == -1. && PyErr_Occurred())
+			goto error;
+
+		double M = mean_anomaly_at_epoch + mean_motion * (time - epoch);
+		PyObject* anomaly = PyFloat_FromDouble(at_mean_anomaly(eccentricity, M));
+		if (anomaly == NULL)
+			goto error;
+		PyList_SET_ITEM(ret, i, anomaly);
+	}
+
+	Py_DECREF(sequence);
+	return ret;
+
+error:
+	Py_DECREF(sequence);
+	Py_DECREF(ret);
+	return NULL;
+}
+
+static PyObject* wrapper_eccentric_anomalies_at_times(PyObject* self, PyObject* args)
+{
+	(void) self;
+	return anomalies_at_times(args, eccentric_anomaly_at_mean_anomaly);
+}
+
+static PyObject* wrapper_true_anomalies_at_times(PyObject* self, PyObject* args)
+{
+	(void) self;
+	return anomalies_at_times(args, true_anomaly_at_mean_anomaly);
+}
+
 
 static PyMethodDef methods[] =
 {
@@ -115,6 +177,16 @@ static PyMethodDef methods[] =
         "true_anomaly_at_eccentric_anomaly",
         wrapper_true_anomaly_at_eccentric_anomaly, METH_VARARGS,
         "Computes the true anomaly at a given eccentric anomaly",
+    },
+	{
+        "eccentric_anomalies_at_times",
+        wrapper_eccentric_anomalies_at_times, METH_VARARGS,
+        "Computes the eccentric anomalies at given times",
+    },
+	{
+        "true_anomalies_at_times",
+        wrapper_true_anomalies_at_times, METH_VARARGS,
+        "Computes the true anomalies at given times",
     },
 	{NULL, NULL, 0, NULL}
 };
@@ -52,7 +52,8 @@ class Orbit(
 
         self.primary = primary
         self.periapsis = float(periapsis)
-        self.eccentricity = float(eccentricity)
+        # sets eccentricity and the constants derived from it
+        spyce.orbit_angles.OrbitGeometry.__init__(self, float(eccentricity))
         self.inclination = float(inclination)
         self.longitude_of_ascending_node = float(longitude_of_ascending_node)
         self.argument_of_periapsis = float(argument_of_periapsis)
@@ -78,6 +79,11 @@ class Orbit(
             self.mean_motion = 3 * math.sqrt(mu / self.semi_latus_rectum**3)
         else:
             self.mean_motion = math.sqrt(mu / abs(self.semi_major_axis)**3)
+        # time_at_mean_anomaly() multiplies rather than divides
+        if self.mean_motion == 0:  # massless primary
+            self._inv_mean_motion = math.inf
+        else:
+            self._inv_mean_motion = 1 / self.mean_motion
 
         # period
         if self.eccentricity >= 1:  # parabolic/hyperbolic trajectory
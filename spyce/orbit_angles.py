@@ -1,12 +1,114 @@
 import sys
 import math
+import functools
 
-import spyce.analysis
+# cbrt() is new in Python 3.11
+try:
+    from math import cbrt
+except ImportError:
+    def cbrt(x):
+        return math.copysign(abs(x)**(1/3), x)
+
+
+@functools.lru_cache(maxsize=1024)
+def _eccentric_anomaly_at_mean_anomaly(e, M):
+    """Solve Kepler's equation (see OrbitGeometry)
+
+    The last results are cached: drawing a paused simulation, or the same
+    orbit several times per frame, solves for the same values repeatedly"""
+    if e < 1:  # M = E - e sin E
+        M %= (2*math.pi)
+
+        # sin(E) = E -> M = (1 - e) E
+        if abs(M) < 2**-26:
+            return M / (1 - e)
+
+        # nearly circular orbits: third-order series in e, refined by one
+        # Newton step, is exact to machine precision for small e
+        if e < 2**-6:
+            sM = math.sin(M)
+            cM = math.cos(M)
+            E = M + e*sM*(1 + e*cM + e*e*(1 - 1.5*sM*sM))
+            return E - (E - e*math.sin(E) - M) / (1 - e*math.cos(E))
+
+        # non-iterative solver from F. L. Markley, "Kepler Equation
+        # Solver", Celestial Mechanics and Dynamical Astronomy 63 (1995)
+        # starter, from a cubic approximation of sin(E), on [-pi, pi]
+        if M > math.pi:
+            M -= 2*math.pi
+        pi2 = math.pi**2
+        alpha = (3*pi2 + 1.6*math.pi*(math.pi-abs(M))/(1+e)) / (pi2-6)
+        d = 3*(1-e) + alpha*e
+        q = 2*alpha*d*(1-e) - M*M
+        r = 3*alpha*d*(d-1+e)*M + M*M*M
+        w = (abs(r) + math.sqrt(q*q*q + r*r))**(2/3)
+        E = (2*r*w/(w*w + w*q + q*q) + M) / d
+
+        # single fifth-order correction
+        es = e*math.sin(E)
+        ec = e*math.cos(E)
+        f0 = E - es - M
+        f1 = 1 - ec
+        d3 = -f0 / (f1 - f0*es/(2*f1))
+        d4 = -f0 / (f1 + d3*es/2 + d3*d3*ec/6)
+        d5 = -f0 / (f1 + d4*es/2 + d4*d4*ec/6 - d4*d4*d4*es/24)
+        return (E + d5) % (2*math.pi)
+    elif e == 1:  # Barker's equation, solved with Cardano's formula
+        # E = z - 1/z with z^3 = M + sqrt(M^2 + 1); the equation is odd in E,
+        # so solve for positive M, and since z^3 - 1/z^3 = 2M, compute E as
+        # 2M / (z^2 + 1 + 1/z^2), without cancellation for small M
+        z = cbrt(abs(M) + math.hypot(M, 1))
+        z2 = z*z
+        return math.copysign(2*abs(M) / (z2 + 1 + 1/z2), M)
+    else:  # M = e sinh E - E
+        # sinh(E) = E -> M = (e - 1) E
+        if abs(M) < 2**-26:
+            return M / (e - 1)
+
+        # the equation is odd in E; solve for positive M only
+        sign, M = (-1, -M) if M < 0 else (1, M)
+
+        # third-order iteration from J. M. A. Danby, "The solution of
+        # Kepler's equation, III", Celestial Mechanics 40 (1987); all the
+        # derivatives derive from one sinh() call
+        # initial guess: M/(e-1) and cbrt(6M/e) are upper bounds of the
+        # solution, tight for large e and near-parabolic trajectories
+        # respectively; log(2M/e + 1.8) is accurate for large M; starting
+        # from below where f' is small would overshoot wildly
+        E = min(M/(e-1), cbrt(6*M/e), math.log(2*M/e + 1.8))
+        previous_step = math.inf
+        for _ in range(30):  # upper limit on iteration count
+            es = e*math.sinh(E)
+            ec = math.sqrt(e*e + es*es)  # e cosh E
+            f0 = es - E - M
+            f1 = ec - 1
+            d1 = -f0 / f1
+            d2 = -f0 / (f1 + d1*es/2)
+            d3 = -f0 / (f1 + d2*es/2 + d2*d2*ec/6)
+            step = abs(d3)
+            if step >= previous_step:
+                # rounding errors dominate: best accuracy reached
+                break
+            E += d3
+            if step <= 2**-50 * E:
+                # cubic convergence: next step would be negligible
+                break
+            previous_step = step
+        return sign * E
 
 
 class OrbitGeometry:
     def __init__(self, eccentricity):
-        self.eccentricity = eccentricity
+        self.eccentricity = e = eccentricity
+
+        # constants of the anomaly conversions, depending on the eccentricity
+        # only; computed once rather than on every conversion
+        if e < 1:  # circular or elliptic orbit
+            self._sqrt_1_plus_e = math.sqrt(1+e)
+            self._sqrt_1_minus_e = math.sqrt(1-e)
+        elif e > 1:  # hyperbolic trajectory
+            self._sqrt_e_minus_1_over_e_plus_1 = math.sqrt((e-1)/(e+1))
+            self._sqrt_e_plus_1_over_e_minus_1 = math.sqrt((e+1)/(e-1))
 
     def __repr__(self):
         return "%s(eccentricity=%f)" % (type(self).__name__, self.eccentricity)
@@ -38,65 +140,41 @@ class OrbitGeometry:
         return self.mean_anomaly_at_eccentric_anomaly(E)
 
     def eccentric_anomaly_at_mean_anomaly(self, mean_anomaly):
-        M = mean_anomaly
-        e = self.eccentricity
-
-        if e < 1:  # M = E - e sin E
-            M %= (2*math.pi)
-
-            # sin(E) = E -> M = (1 - e) E
-            if abs(M) < 2**-26:
-                return M / (1 - e)
-
-            return spyce.analysis.newton_raphson(
-                x_0=math.pi,
-                f=lambda E: E - e*math.sin(E) - M,
-                f_prime=lambda E: 1 - e*math.cos(E),
-            )
-        elif e == 1:
-            z = (M + math.sqrt(M**2+1))**(1/3)
-            return z - 1/z
-        else:  # M = e sinh E - E
-            # sinh(E) = E -> M = (e - 1) E
-            if abs(M) < 2**-26:
-                return M / (e - 1)
-
-            return spyce.analysis.newton_raphson(
-                x_0=1,
-                f=lambda E: e*math.sinh(E) - E - M,
-                f_prime=lambda E: e*math.cosh(E) - 1,
-            )
+        return _eccentric_anomaly_at_mean_anomaly(self.eccentricity,
+                                                  mean_anomaly)
 
     def eccentric_anomaly_at_true_anomaly(self, true_anomaly):
         """Eccentric anomaly at given time, mean anomaly, or true anomaly"""
-        v = true_anomaly
-        e = self.eccentricity;
+        e = self.eccentricity
+        half_v = true_anomaly / 2
         if e < 1:  # circular or elliptic orbit
-            x = math.sqrt(1+e)*math.cos(v/2)
-            y = math.sqrt(1-e)*math.sin(v/2)
+            x = self._sqrt_1_plus_e*math.cos(half_v)
+            y = self._sqrt_1_minus_e*math.sin(half_v)
             return 2 * math.atan2(y, x)
         elif e == 1:  # parabolic trajectory
-            return math.tan(v / 2)
+            return math.tan(half_v)
         else:  # hyperbolic trajectory
-            return 2 * math.atanh(math.sqrt((e-1)/(e+1)) * math.tan(v/2))
+            k = self._sqrt_e_minus_1_over_e_plus_1
+            return 2 * math.atanh(k * math.tan(half_v))
 
     def true_anomaly_at_mean_anomaly(self, mean_anomaly):
         E = self.eccentric_anomaly_at_mean_anomaly(mean_anomaly)
         return self.true_anomaly_at_eccentric_anomaly(E)
 
     def true_anomaly_at_eccentric_anomaly(self, eccentric_anomaly):
-        E = eccentric_anomaly
-        e = self.eccentricity;
+        e = self.eccentricity
         if e < 1:  # circular or elliptic orbit
-            x = math.sqrt(1-e)*math.cos(E/2)
-            y = math.sqrt(1+e)*math.sin(E/2)
+            half_E = eccentric_anomaly / 2
+            x = self._sqrt_1_minus_e*math.cos(half_E)
+            y = self._sqrt_1_plus_e*math.sin(half_E)
             return 2 * math.atan2(y, x)
         elif e == 1:  # parabolic trajectory
-            return 2 * math.atan(E)
+            return 2 * math.atan(eccentric_anomaly)
         else:  # hyperbolic trajectory
-            x = math.sqrt(e-1)*math.cosh(E/2)
-            y = math.sqrt(e+1)*math.sinh(E/2)
-            return 2 * math.atan2(y, x)
+            # tan(v/2) = sqrt((e+1)/(e-1)) tanh(E/2); cosh(E/2) > 0 so no
+            # quadrant needs to be recovered with atan2()
+            k = self._sqrt_e_plus_1_over_e_minus_1
+            return 2 * math.atan(k * math.tanh(eccentric_anomaly / 2))
 
 
 class OrbitAngles(OrbitGeometry):
@@ -105,7 +183,7 @@ class OrbitAngles(OrbitGeometry):
 
     def time_at_mean_anomaly(self, mean_anomaly):
         return self.epoch + \
-            (mean_anomaly - self.mean_anomaly_at_epoch) / self.mean_motion
+            (mean_anomaly - self.mean_anomaly_at_epoch) * self._inv_mean_motion
 
     def time_at_eccentric_anomaly(self, eccentric_anomaly):
         M = self.mean_anomaly_at_eccentric_anomaly(eccentric_anomaly)
@@ -127,33 +205,54 @@ class OrbitAngles(OrbitGeometry):
         M = self.mean_anomaly_at_time(time)
         return self.true_anomaly_at_mean_anomaly(M)
 
+    def eccentric_anomalies_at_times(self, times):
+        """Eccentric anomalies at each of the given times
+
+        Same as calling eccentric_anomaly_at_time() for each time, but the
+        orbit's attributes are only looked up once for the whole batch"""
+        n = self.mean_motion
+        t0 = self.epoch
+        M0 = self.mean_anomaly_at_epoch
+        solve = self.eccentric_anomaly_at_mean_anomaly
+        return [solve(M0 + n * (time - t0)) for time in times]
+
+    def true_anomalies_at_times(self, times):
+        """True anomalies at each of the given times
+
+        See eccentric_anomalies_at_times()"""
+        n = self.mean_motion
+        t0 = self.epoch
+        M0 = self.mean_anomaly_at_epoch
+        solve = self.true_anomaly_at_mean_anomaly
+        return [solve(M0 + n * (time - t0)) for time in times]
+
     def true_anomaly_at_distance(self, distance):
         """Positive true anomaly when at the given distance from focus
 
         A non-circular orbit may reach a specific distance either once
         (periapsis and apoapsis), twice (anything in between) or never. Those
         two points always have opposite true anomalies. The positive one is
-        returned if it exists; otherwise, None is returnd.
+        returned if it exists; otherwise, None is returned.
 
         A circular orbit is either always or never at the distance. For this
         reason, they always return None.
         """
+        e = self.eccentricity
 
         # circular orbit
-        if self.eccentricity == 0:
-            return math.nan
+        if e == 0:
+            return None
 
         # periapsis too high
         if distance < self.periapsis:
-            return math.nan
+            return None
 
         # closed orbit and apoapsis too low
-        if 0 < self.apoapsis < distance:
-            return math.nan
+        apoapsis = self.apoapsis
+        if 0 < apoapsis < distance:
+            return None
 
-        return math.acos(
-            (self.semi_latus_rectum / distance - 1) / self.eccentricity
-        )
+        return math.acos((self.semi_latus_rectum / distance - 1) / e)
 
     def true_anomaly_at_escape(self):
         """True anomaly when escaping the primary's sphere of influence"""
@@ -166,8 +265,43 @@ try:
 except ImportError:
     print("Note: to improve performance, run `make` in cext/", file=sys.stderr)
 else:
+    def eccentric_anomaly_at_mean_anomaly(self, mean_anomaly):
+        e = self.eccentricity
+        M = mean_anomaly
+        return cext.eccentric_anomaly_at_mean_anomaly(e, M)
+    OrbitGeometry.eccentric_anomaly_at_mean_anomaly = \
+        eccentric_anomaly_at_mean_anomaly
+
     def true_anomaly_at_mean_anomaly(self, mean_anomaly):
         e = self.eccentricity
         M = mean_anomaly
         return cext.true_anomaly_at_mean_anomaly(e, M)
     OrbitGeometry.true_anomaly_at_mean_anomaly = true_anomaly_at_mean_anomaly
+
+    def eccentric_anomaly_at_true_anomaly(self, true_anomaly):
+        e = self.eccentricity
+        v = true_anomaly
+        return cext.eccentric_anomaly_at_true_anomaly(e, v)
+    OrbitGeometry.eccentric_anomaly_at_true_anomaly = \
+        eccentric_anomaly_at_true_anomaly
+
+    def true_anomaly_at_eccentric_anomaly(self, eccentric_anomaly):
+        e = self.eccentricity
+        E = eccentric_anomaly
+        return cext.true_anomaly_at_eccentric_anomaly(e, E)
+    OrbitGeometry.true_anomaly_at_eccentric_anomaly = \
+        true_anomaly_at_eccentric_anomaly
+
+    def eccentric_anomalies_at_times(self, times):
+        return cext.eccentric_anomalies_at_times(
+            self.eccentricity, self.mean_anomaly_at_epoch, self.mean_motion,
+            self.epoch, times,
+        )
+    OrbitAngles.eccentric_anomalies_at_times = eccentric_anomalies_at_times
+
+    def true_anomalies_at_times(self, times):
+        return cext.true_anomalies_at_times(
+            self.eccentricity, self.mean_anomaly_at_epoch, self.mean_motion,
+            self.epoch, times,
+        )
+    OrbitAngles.true_anomalies_at_times = true_anomalies_at_times
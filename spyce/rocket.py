@@ -51,6 +51,33 @@ class RocketPart:
         self.propellant = propellant
 
 
+def state_derivative(primary, thrust):
+    """Derivative of a rocket state under gravity and constant thrust
+
+    The state is [x, y, z, vx, vy, vz], relative to `primary` (possibly
+    None); `thrust` is an acceleration vector. The returned function f(t,
+    state) is suitable for spyce.analysis.runge_kutta_4()."""
+    # plain floats rather than Vec3 since this is called 4 times per step
+    thrust_x, thrust_y, thrust_z = thrust
+
+    def f(t, state):
+        x, y, z, vx, vy, vz = state
+
+        # gravity
+        if primary:
+            distance = math.sqrt(math.fsum([x*x, y*y, z*z]))
+            k = -primary.gravity(distance)/distance
+        else:
+            k = 0.
+
+        # propulsion
+        return [
+            vx, vy, vz,
+            x*k + thrust_x, y*k + thrust_y, z*k + thrust_z,
+        ]
+    return f
+
+
 class Rocket(spyce.body.CelestialBody):
     """A rocket, or a spaceship, or a duck"""
     def __init__(self, primary=None, program=None):
@@ -177,21 +204,7 @@ class Rocket(spyce.body.CelestialBody):
         else:
             thrust = Vec3([0, 0, 0])
 
-        def f(t, y):
-            position, velocity = Vec3(y[:3]), y[3:]
-
-            # gravity
-            if self.primary:
-                distance = position.norm()
-                g = self.primary.gravity(distance)
-                acceleration = position * (-g/distance)
-            else:
-                acceleration = Vec3([0, 0, 0])
-
-            # propulsion
-            acceleration += thrust
-
-            return velocity + acceleration
+        f = state_derivative(self.primary, thrust)
 
         # update velocity and position
         y = self.position[:] + self.velocity
@@ -10,6 +10,9 @@ import math
 
 
 class Vec3(list):
+    # vectors are created in the hot loops; skip the per-instance __dict__
+    __slots__ = ()
+
     def norm(u):
         return math.sqrt(u.dot(u))
 
@@ -83,6 +86,8 @@ class Vec3(list):
 
 
 class Mat3(list):
+    __slots__ = ()
+
     def __init__(cls, *args, **kwargs):
         if args or kwargs:
             super().__init__(*args, **kwargs)
@@ -133,11 +138,15 @@ class Mat3(list):
 
 
 class Vec4(list):
+    __slots__ = ()
+
     def __init__(cls, x=0, y=0, z=0, w=1):
         super().__init__([x, y, z, w])
 
 
 class Mat4:
+    __slots__ = ('v',)
+
     def __init__(self, v=None):
         if v is None:
             self.v = [
@@ -34,6 +34,26 @@ class TestBody(unittest.TestCase):
         local_time = planet.time2str(time)
         self.assertAlmostEqual(planet.str2time(local_time), time, places=0)
 
+        # no negative zero
+        self.assertEqual(planet.time2str(0.), '+0y,   0d,  0:00:00.0')
+        self.assertEqual(planet.time2str(-0.), '+0y,   0d,  0:00:00.0')
+
+    def test_global_position_at_time(self):
+        Sun = spyce.load.solar['Sun']
+        Earth = spyce.load.solar['Earth']
+        Moon = spyce.load.solar['Moon']
+
+        self.assertEqual(Sun.global_position_at_time(1e6), [0, 0, 0])
+
+        for time in (1e6, 2e6, 1e6):
+            expected = (
+                Earth.orbit.position_at_time(time) +
+                Moon.orbit.position_at_time(time)
+            )
+            self.assertEqual(Moon.global_position_at_time(time), expected)
+            self.assertEqual(Earth.global_position_at_time(time),
+                             Earth.orbit.position_at_time(time))
+
     def test_escape_velocity_at_distance(self):
         Earth = spyce.load.solar['Earth']
         escape_velocity = Earth.escape_velocity_at_distance(Earth.radius)
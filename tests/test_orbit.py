@@ -3,6 +3,8 @@ import math
 import itertools
 
 from spyce.orbit import Orbit
+from spyce.orbit_angles import OrbitGeometry
+import spyce.orbit_angles
 from spyce.orbit_determination import InvalidElements
 
 
@@ -128,6 +130,13 @@ class TestOrbit(unittest.TestCase):
         self.assertIsClose(o.mean_anomaly_at_true_anomaly(v), M, msg=o)
         self.assertIsClose(o.time_at_true_anomaly(v), time, msg=o)
 
+        # check batch conversions
+        times = [-1e6, 0, 1e4, 1e6]
+        self.assertEqual(o.eccentric_anomalies_at_times(times),
+                         [o.eccentric_anomaly_at_time(t) for t in times])
+        self.assertEqual(o.true_anomalies_at_times(times),
+                         [o.true_anomaly_at_time(t) for t in times])
+
     def test_all(self):
         periapsis = (1e9, 1e13)
         eccentricity = (0.0, 0.00001, 0.5, 0.99999, 1.0, 1.00001, 10.0)
@@ -136,6 +145,88 @@ class TestOrbit(unittest.TestCase):
                                           angle, angle):
             self.orbit(Orbit(primary, *elements))
 
+    def test_true_anomaly_at_distance(self):
+        # circular orbit
+        o = Orbit(primary, 700e3, 0)
+        self.assertIsNone(o.true_anomaly_at_distance(700e3))
+
+        o = Orbit(primary, 700e3, 0.5)  # apoapsis at 2100 km
+        self.assertIsClose(o.true_anomaly_at_distance(700e3), 0, abs_tol=1e-9)
+        self.assertIsClose(o.true_anomaly_at_distance(2100e3), math.pi)
+        v = o.true_anomaly_at_distance(1e6)
+        self.assertIsClose(o.distance_at_true_anomaly(v), 1e6)
+        # below periapsis
+        self.assertIsNone(o.true_anomaly_at_distance(500e3))
+        # above apoapsis
+        self.assertIsNone(o.true_anomaly_at_distance(3000e3))
+
+        # escape
+        class Planet(DummyPrimary):
+            sphere_of_influence = 1e7
+        self.assertIsNone(Orbit(Planet(), 700e3, 0).true_anomaly_at_escape())
+        self.assertIsNone(Orbit(Planet(), 700e3, .5).true_anomaly_at_escape())
+        o = Orbit(Planet(), 700e3, 2)
+        v = o.true_anomaly_at_escape()
+        self.assertIsClose(o.distance_at_true_anomaly(v), 1e7)
+
+    def test_parabolic_kepler(self):
+        o = OrbitGeometry(1.0)
+        # used to raise ZeroDivisionError for large negative mean anomalies
+        for M in (1e-12, 1e-6, 0.5, 1.0, 1e3, 1e8, 1e15):
+            msg = 'M={}'.format(M)
+            E = o.eccentric_anomaly_at_mean_anomaly(M)
+            self.assertIsClose(o.mean_anomaly_at_eccentric_anomaly(E), M,
+                               rel_tol=1e-14, msg=msg)
+            self.assertEqual(o.eccentric_anomaly_at_mean_anomaly(-M), -E,
+                             msg=msg)
+        # M = (E^3 + 3E) / 2 -> E ~ cbrt(2M)
+        E = o.eccentric_anomaly_at_mean_anomaly(-1e8)
+        self.assertIsClose(E, -584.8018376666265, rel_tol=1e-14)
+
+    def test_hyperbolic_kepler(self):
+        # large mean anomalies used to make Newton's method diverge
+        eccentricity = (1 + 2**-20, 1.00001, 1.01, 1.5, 2.0, 10.0, 1e3)
+        mean_anomaly = (1e-6, 0.1, 1.0, 50.0, 1e3, 1e6, 1e12)
+        for e, M in itertools.product(eccentricity, mean_anomaly):
+            o = OrbitGeometry(e)
+            for M in (M, -M):
+                msg = 'e={}, M={}'.format(e, M)
+                E = o.eccentric_anomaly_at_mean_anomaly(M)
+                self.assertEqual(math.copysign(1, E), math.copysign(1, M))
+                residual = e*math.sinh(E) - E - M
+                self.assertLess(abs(residual), 1e-14*max(abs(M), abs(E)),
+                                msg=msg)
+
+        # cosh(E/2) and sinh(E/2) overflow for large eccentric anomalies
+        o = OrbitGeometry(2.0)
+        self.assertIsClose(o.true_anomaly_at_eccentric_anomaly(2000),
+                           o.ejection_angle())
+        self.assertIsClose(o.true_anomaly_at_eccentric_anomaly(-2000),
+                           -o.ejection_angle())
+
+    @unittest.skipUnless(hasattr(spyce.orbit_angles, 'cext'),
+                         'C extension not built')
+    def test_cext(self):
+        # the C extension replaces the methods of OrbitGeometry; it must not
+        # hide changes made to the pure Python solver
+        python_solve = spyce.orbit_angles._eccentric_anomaly_at_mean_anomaly
+        c_solve = spyce.orbit_angles.cext.eccentric_anomaly_at_mean_anomaly
+        eccentricity = (0.0, 0.001, 0.5, 0.99999, 1.0, 1.00001, 1.5, 10.0)
+        mean_anomaly = (0.0, 1e-9, 0.1, 1.0, 3.0, 50.0, 1e3, 1e9)
+        for e, M in itertools.product(eccentricity, mean_anomaly):
+            for M in (M, -M):
+                msg = 'e={}, M={}'.format(e, M)
+                self.assertIsClose(c_solve(e, M), python_solve(e, M),
+                                   rel_tol=1e-14, msg=msg)
+
+    def test_massless_primary(self):
+        # open trajectories around bodies with no gravitational parameter
+        class MasslessPrimary(DummyPrimary):
+            gravitational_parameter = 0
+        o = Orbit(MasslessPrimary(), 1e6, 2.0)
+        self.assertEqual(o.mean_motion, 0)
+        self.assertEqual(o.time_at_mean_anomaly(1.), math.inf)
+
     def test_invalid(self):
         # circular or elliptic orbit should have positive semi-major axis
         with self.assertRaises(InvalidElements):
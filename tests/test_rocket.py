@@ -1,5 +1,8 @@
 import unittest
+import random
 
+from spyce.vector import Vec3
+import spyce.body
 import spyce.orbit
 import spyce.ksp_cfg
 import spyce.rocket
@@ -46,6 +49,33 @@ class TestRocket(unittest.TestCase):
         self.do_simulation(1.)
         self.do_simulation(2.)
 
+    def test_state_derivative(self):
+        def reference(primary, thrust):
+            # straightforward Vec3 implementation
+            def f(t, y):
+                position, velocity = Vec3(y[:3]), y[3:]
+                if primary:
+                    distance = position.norm()
+                    g = primary.gravity(distance)
+                    acceleration = position * (-g/distance)
+                else:
+                    acceleration = Vec3([0, 0, 0])
+                acceleration += thrust
+                return velocity + acceleration
+            return f
+
+        planet = spyce.body.CelestialBody('planet', 3.5e12, 6e5)
+        for primary in (planet, None):
+            for _ in range(100):
+                thrust = Vec3([random.uniform(-10, 10) for _ in range(3)])
+                # both above and below the surface (shell theorem)
+                state = [random.uniform(-1e6, 1e6) for _ in range(3)]
+                state += [random.uniform(-3e3, 3e3) for _ in range(3)]
+                self.assertEqual(
+                    spyce.rocket.state_derivative(primary, thrust)(0, state),
+                    reference(primary, thrust)(0, state),
+                )
+
 
 if __name__ == '__main__':
     unittest.main()